@@ -1,18 +1,39 @@
 """Code Bundler - Combine and transform source code files for LLM usage."""
 
+import importlib
 from importlib.metadata import version
+from typing import TYPE_CHECKING, Any
 
 try:
     __version__ = version("codebundler")
 except Exception:
     __version__ = "unknown"
 
-# Public API
-from codebundler.core.transformers import apply_transformations, get_comment_prefix
-from codebundler.tui.bundler import create_bundle
+if TYPE_CHECKING:
+    from codebundler.core.transformers import apply_transformations, get_comment_prefix
+    from codebundler.tui.bundler import CombineStats, create_bundle
+
+# Public API, imported on first attribute access (PEP 562)
+_LAZY = {
+    "create_bundle": "codebundler.tui.bundler",
+    "CombineStats": "codebundler.tui.bundler",
+    "apply_transformations": "codebundler.core.transformers",
+    "get_comment_prefix": "codebundler.core.transformers",
+}
 
 __all__ = [
     "create_bundle",
+    "CombineStats",
     "apply_transformations",
     "get_comment_prefix",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule that provides ``name`` and cache the attribute."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -1,57 +1,116 @@
 """Command line interface for the package."""
 
 import argparse
+import atexit
 import logging
-import os
+import logging.handlers
+import queue
 import sys
-import time
 from typing import List, Optional
 
-from rich.table import Table
-
 from codebundler import __version__
 
-# Import utility functions
-from codebundler.utils.helpers import (
-    console,
-    create_panel,
-    display_summary,
-    print_error,
-    print_info,
-    print_success,
-    print_warning,
+logger = logging.getLogger(__name__)
+
+# Third-party loggers that are quieted below debug verbosity
+_LIBRARY_LOGGERS = ("asyncio", "markdown_it", "textual", "urllib3", "watchdog")
+
+# Formatters for the plain stdout handler; timestamps only at debug verbosity
+_FORMATTER = logging.Formatter("%(levelname)s: %(message)s")
+_DETAILED_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
 )
 
-logger = logging.getLogger(__name__)
+# Flags understood by _parse_fast(), mapped to the (dest, value) they store
+_FAST_FLAGS = {
+    "-y": ("confirm_selection", False),
+    "--yes": ("confirm_selection", False),
+    "--strip-comments": ("strip_comments", True),
+    "--no-strip-comments": ("strip_comments", False),
+    "--remove-docstrings": ("remove_docstrings", True),
+    "--no-remove-docstrings": ("remove_docstrings", False),
+    "-q": ("quiet", True),
+    "--quiet": ("quiet", True),
+}
+_FAST_VALUE_OPTIONS = {"--ignore": "hide_patterns", "--select": "select_patterns"}
+
+# Welcome banner, rendered once at import time
+_BANNER = (
+    f"\n[bold cyan]{'=' * 30}[/bold cyan]\n"
+    "[bold cyan]CODE BUNDLER[/bold cyan]\n"
+    f"[cyan]{'-' * 30}[/cyan]\n"
+    "[dim]Combine and transform source code for LLM usage[/dim]\n"
+    f"[dim]Version {__version__} | MIT License | Author: Ben Moore[/dim]\n"
+    f"[bold cyan]{'=' * 30}[/bold cyan]\n"
+)
+
+# Parser built on first use by setup_parser()
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+# Background listener that drains queued log records into the output handler
+_log_listener: Optional[logging.handlers.QueueListener] = None
 
 
 class RichLogHandler(logging.Handler):
     """Custom log handler that uses Rich for formatting."""
 
+    # Rich markup prefix and line style for each standard log level
+    _STYLES = {
+        logging.DEBUG: ("[cyan]DEBUG:[/cyan]", None),
+        logging.INFO: ("[green]INFO:[/green]", None),
+        logging.WARNING: ("[yellow]WARNING:[/yellow]", "yellow"),
+        logging.ERROR: ("[red]ERROR:[/red]", "red"),
+        logging.CRITICAL: ("[bold red]CRITICAL:[/bold red]", "red"),
+    }
+
+    def __init__(self, level: int = logging.NOTSET):
+        """Initialize the handler with the shared Rich console."""
+        super().__init__(level)
+        from codebundler.utils.helpers import console
+
+        self.console = console
+
     def emit(self, record):
-        level_styles = {
-            logging.DEBUG: "[cyan]DEBUG:[/cyan]",
-            logging.INFO: "[green]INFO:[/green]",
-            logging.WARNING: "[yellow]WARNING:[/yellow]",
-            logging.ERROR: "[red]ERROR:[/red]",
-            logging.CRITICAL: "[bold red]CRITICAL:[/bold red]",
-        }
-
-        level_prefix = level_styles.get(
-            record.levelno, f"[bold]LEVEL {record.levelno}:[/bold]"
+        level_prefix, style = self._STYLES.get(
+            record.levelno, (f"[bold]LEVEL {record.levelno}:[/bold]", None)
         )
 
-        # Format the message based on the log level
-        if record.levelno >= logging.ERROR:
-            console.print(f"{level_prefix} {record.getMessage()}", style="red")
-        elif record.levelno >= logging.WARNING:
-            console.print(f"{level_prefix} {record.getMessage()}", style="yellow")
-        elif record.levelno >= logging.INFO:
-            console.print(f"{level_prefix} {record.getMessage()}")
-        else:  # DEBUG level
+        if record.levelno < logging.INFO:
             # Include more details for debug messages
-            module_part = f"[dim]{record.name}[/dim]" if hasattr(record, "name") else ""
-            console.print(f"{level_prefix} {module_part} {record.getMessage()}")
+            self.console.print(
+                level_prefix, f"[dim]{record.name}[/dim]", record.getMessage()
+            )
+        else:
+            self.console.print(level_prefix, record.getMessage(), style=style)
+
+
+class StdoutHandler(logging.Handler):
+    """Log handler that writes to whatever ``sys.stdout`` is at emit time.
+
+    Unlike ``StreamHandler(sys.stdout)`` this follows the capture Textual
+    installs while the TUI runs, so log lines never land on the live screen.
+    """
+
+    def emit(self, record):
+        try:
+            stream = sys.stdout
+            stream.write(self.format(record) + "\n")
+            stream.flush()
+        except Exception:
+            self.handleError(record)
+
+
+def stop_log_listener() -> None:
+    """Flush queued log records and stop the background log listener."""
+    global _log_listener
+
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+atexit.register(stop_log_listener)
 
 
 def configure_logging(verbosity: int) -> None:
@@ -61,6 +120,8 @@ def configure_logging(verbosity: int) -> None:
     Args:
         verbosity: Verbosity level (0=ERROR, 1=WARNING, 2=INFO, 3+=DEBUG)
     """
+    global _log_listener
+
     log_levels = {
         0: logging.ERROR,
         1: logging.WARNING,
@@ -71,27 +132,52 @@ def configure_logging(verbosity: int) -> None:
     # Cap at level 3
     verbosity = min(verbosity, 3)
 
-    # Configure root logger
-    logging.basicConfig(
-        level=log_levels[verbosity],
-        format="%(message)s",
-        handlers=[RichLogHandler()],
+    # Stop any listener left over from a previous call
+    stop_log_listener()
+
+    # Rich markup is only worth its cost for interactive debug output
+    if verbosity >= 3 and sys.stdout.isatty():
+        handler = RichLogHandler()
+    else:
+        handler = StdoutHandler()
+        handler.setFormatter(_DETAILED_FORMATTER if verbosity >= 3 else _FORMATTER)
+
+    # Producers only enqueue records; rendering happens on the listener thread
+    log_queue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, handler, respect_handler_level=True
     )
+    _log_listener.start()
+
+    # Configure root logger, replacing handlers from any earlier call
+    root = logging.getLogger()
+    for old_handler in root.handlers[:]:
+        root.removeHandler(old_handler)
+        old_handler.close()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(log_levels[verbosity])
 
     # Set the log level for third-party libraries to WARNING unless in debug mode
     if verbosity < 3:
-        for logger_name in logging.root.manager.loggerDict:
-            if not logger_name.startswith("codebundler"):
-                logging.getLogger(logger_name).setLevel(logging.WARNING)
+        library_level = max(logging.WARNING, log_levels[verbosity])
+        for logger_name in _LIBRARY_LOGGERS:
+            logging.getLogger(logger_name).setLevel(library_level)
 
 
 def setup_parser() -> argparse.ArgumentParser:
     """
     Set up the command line argument parser.
 
+    The parser is built once and reused on later calls.
+
     Returns:
         Configured argument parser
     """
+    global _PARSER
+
+    if _PARSER is not None:
+        return _PARSER
+
     parser = argparse.ArgumentParser(
         description=(
             "Combine source files with optional transformations. "
@@ -107,6 +193,7 @@ def setup_parser() -> argparse.ArgumentParser:
 
     # Information options
     info_group.add_argument(
+        "-V",
         "--version",
         action="version",
         version=f"codebundler {__version__}",
@@ -197,26 +284,65 @@ def setup_parser() -> argparse.ArgumentParser:
     # We want None as default so we can detect if user explicitly set these flags
     parser.set_defaults(strip_comments=None, remove_docstrings=None)
 
+    _PARSER = parser
     return parser
 
 
+def _parse_fast(argv: List[str]) -> Optional[argparse.Namespace]:
+    """
+    Parse the common command line shapes without building the parser.
+
+    Handles the two positional arguments plus the boolean flags, -v
+    counting and the ``--ignore=``/``--select=`` forms. Anything else
+    (help, abbreviations, bare ``--ignore``/``--select``, errors) is left
+    to argparse.
+
+    Args:
+        argv: Command line arguments
+
+    Returns:
+        Parsed arguments, or None if argv needs the full argument parser
+    """
+    # Same defaults setup_parser() gives these options
+    parsed_args = argparse.Namespace(
+        hide_patterns="",
+        select_patterns="",
+        confirm_selection=True,
+        strip_comments=None,
+        remove_docstrings=None,
+        verbose=0,
+        quiet=False,
+    )
+    positionals = []
+
+    for arg in argv:
+        if not arg.startswith("-"):
+            positionals.append(arg)
+        elif arg in _FAST_FLAGS:
+            dest, value = _FAST_FLAGS[arg]
+            setattr(parsed_args, dest, value)
+        elif arg == "--verbose":
+            parsed_args.verbose += 1
+        elif len(arg) > 1 and arg[1:] == "v" * (len(arg) - 1):
+            parsed_args.verbose += len(arg) - 1
+        else:
+            option, separator, value = arg.partition("=")
+            if not separator or option not in _FAST_VALUE_OPTIONS:
+                return None
+            setattr(parsed_args, _FAST_VALUE_OPTIONS[option], value)
+
+    if len(positionals) != 2:
+        return None
+
+    parsed_args.source_dir, parsed_args.output_file = positionals
+    return parsed_args
+
+
 def display_welcome_banner() -> None:
     """Display a welcome banner when the application starts."""
-    # Create a table for the header
-    table = Table(show_header=False, box=None, padding=(0, 1))
-    table.add_column(justify="left", width=os.get_terminal_size().columns - 4)
+    from codebundler.utils.helpers import console
 
-    # Add a fancy ASCII art banner
-    table.add_row(f"[bold cyan]{'='*30}[/bold cyan]")
-    table.add_row(f"[bold cyan]CODE BUNDLER[/bold cyan]")
-    table.add_row(f"[cyan]{'-'*30}[/cyan]")
-    table.add_row(f"[dim]Combine and transform source code for LLM usage[/dim]")
-    table.add_row(f"[dim]Version {__version__} | MIT License | Author: Ben Moore[/dim]")
-    table.add_row(f"[bold cyan]{'='*30}[/bold cyan]")
-
-    console.print()
-    console.print(table)
-    console.print()
+    console.print(_BANNER)
 
 
 def setup_tui_mode(parsed_args):
@@ -229,6 +355,8 @@ def setup_tui_mode(parsed_args):
     Returns:
         Exit code
     """
+    from codebundler.utils.helpers import print_error, print_info
+
     try:
         # Source dir and output file are now required positional arguments
 
@@ -278,16 +406,27 @@ def main(args: Optional[List[str]] = None) -> int:
     Returns:
         Exit code
     """
+    if args is None:
+        args = sys.argv[1:]
+
+    # Answer -V/--version without building the parser; like argparse, it wins
+    # wherever it appears before a "--" separator
+    options = args[: args.index("--")] if "--" in args else args
+    if "-V" in options or "--version" in options:
+        print(f"codebundler {__version__}")
+        return 0
+
     try:
-        # Parse arguments
-        parser = setup_parser()
-        parsed_args = parser.parse_args(args)
+        # Parse arguments, skipping argparse for the common forms
+        parsed_args = _parse_fast(args)
+        if parsed_args is None:
+            parsed_args = setup_parser().parse_args(args)
 
         # Setup logging first
         configure_logging(parsed_args.verbose)
 
-        # Display welcome banner (if not in quiet mode)
-        if parsed_args.verbose >= 0:
+        # Display welcome banner (only when asked for more output)
+        if not parsed_args.quiet and parsed_args.verbose > 0:
             display_welcome_banner()
 
         # Launch TUI interface
@@ -305,9 +444,13 @@ def main(args: Optional[List[str]] = None) -> int:
         return setup_tui_mode(parsed_args)
 
     except KeyboardInterrupt:
+        from codebundler.utils.helpers import console
+
         console.print("\n[bold red]Operation canceled by user.[/bold red]")
         return 1
     except Exception as e:
+        from codebundler.utils.helpers import print_error
+
         print_error(f"Unexpected error: {e}")
         logger.debug("Detailed error:", exc_info=True)
         return 1
@@ -1,15 +1,37 @@
 """Core functionality for Code Bundler."""
 
-# This makes imports cleaner for other modules
-from codebundler.core.filters import should_ignore, should_include
-from codebundler.core.transformers import (
-    apply_transformations,
-    get_comment_prefix,
-    remove_python_docstrings,
-    strip_single_line_comments,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from codebundler.core.filters import (
+        compile_glob_matcher,
+        compile_keyword_matcher,
+        should_ignore,
+        should_include,
+    )
+    from codebundler.core.transformers import (
+        apply_transformations,
+        get_comment_prefix,
+        remove_python_docstrings,
+        strip_single_line_comments,
+    )
+
+# Submodules are imported on first attribute access (PEP 562)
+_LAZY = {
+    "compile_glob_matcher": "codebundler.core.filters",
+    "compile_keyword_matcher": "codebundler.core.filters",
+    "should_ignore": "codebundler.core.filters",
+    "should_include": "codebundler.core.filters",
+    "apply_transformations": "codebundler.core.transformers",
+    "get_comment_prefix": "codebundler.core.transformers",
+    "remove_python_docstrings": "codebundler.core.transformers",
+    "strip_single_line_comments": "codebundler.core.transformers",
+}
 
 __all__ = [
+    "compile_glob_matcher",
+    "compile_keyword_matcher",
     "should_ignore",
     "should_include",
     "apply_transformations",
@@ -17,3 +39,13 @@ __all__ = [
     "remove_python_docstrings",
     "strip_single_line_comments",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule that provides ``name`` and cache the attribute."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -1,6 +1,9 @@
 """Filtering operations for file selection."""
 
-from typing import List
+import fnmatch
+import os
+import re
+from typing import List, Optional, Pattern
 
 
 def should_include(filename: str, include_names: List[str]) -> bool:
@@ -41,3 +44,44 @@ def should_ignore(
     if any(keyword in rel_path for keyword in ignore_paths):
         return True
     return False
+
+
+def compile_keyword_matcher(keywords: List[str]) -> Optional[Pattern[str]]:
+    """
+    Compile keywords into a single regex matching any of them as a substring.
+
+    ``matcher.search(text)`` is equivalent to
+    ``any(keyword in text for keyword in keywords)`` but runs as one scan.
+
+    Args:
+        keywords: List of keywords to match
+
+    Returns:
+        Compiled pattern, or None if there are no keywords
+    """
+    if not keywords:
+        return None
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+def compile_glob_matcher(patterns: List[str]) -> Optional[Pattern[str]]:
+    """
+    Compile glob patterns into a single regex matching any of them.
+
+    ``matcher.match(os.path.normcase(name))`` is equivalent to
+    ``any(fnmatch.fnmatch(name, pattern) for pattern in patterns)``.
+
+    Args:
+        patterns: List of glob patterns to match
+
+    Returns:
+        Compiled pattern, or None if there are no patterns
+    """
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(
+            f"(?:{fnmatch.translate(os.path.normcase(pattern))})"
+            for pattern in patterns
+        )
+    )
@@ -1,7 +1,9 @@
 """Main TUI application for CodeBundler."""
 
+import asyncio
 import logging
 import os
+import threading
 from pathlib import Path
 from typing import List, Optional, Set
 
@@ -12,7 +14,7 @@ from textual.containers import Container, Grid, Horizontal, Vertical
 from textual.screen import ModalScreen
 from textual.widgets import Button, Footer, Header, Label, Static, Tree
 
-from codebundler.tui.bundler import create_bundle
+from codebundler.tui.bundler import CombineStats, create_bundle
 from codebundler.tui.widgets.directory_tree import DirectoryTree
 from codebundler.utils.watcher import watch_directory
 
@@ -209,6 +211,8 @@ class CodeBundlerApp(App):
         """Initialize the application with configuration parameters."""
         super().__init__()
         self.watch_path = Path(watch_path).resolve()
+        # String form of the resolved root, reused for every path operation
+        self._watch_str = str(self.watch_path)
         self.output_file = output_file
 
         # We don't filter by extension in the TUI
@@ -223,6 +227,12 @@ class CodeBundlerApp(App):
         self.confirm_selection = confirm_selection
         self.selected_files = set()
         self.observer = None
+        # Encoded bundle segments, reused for files that have not changed
+        self._segment_cache = {}
+        # Serializes bundle writes running on executor threads
+        self._bundle_lock = threading.Lock()
+        # Bumped by each rebuild so an older queued write can tell it is stale
+        self._bundle_generation = 0
 
     def compose(self) -> ComposeResult:
         """Compose the user interface layout."""
@@ -258,19 +268,26 @@ class CodeBundlerApp(App):
             yield self.status_bar
             yield Footer()
 
-    async def on_mount(self) -> None:
+    def on_mount(self) -> None:
         """Set up the application when it first mounts."""
         # Get the directory tree widget
         self.tree = self.query_one(DirectoryTree)
 
-        # Set up initial selection based on patterns
-        await self.tree.setup_initial_selection(self.select_patterns)
+        # Select files in the background so the app handles input meanwhile
+        self.run_worker(self.apply_initial_selection(), exclusive=True)
 
         # Set up file watcher
         self.setup_file_watcher()
 
+    async def apply_initial_selection(self) -> None:
+        """Apply the select patterns once the tree is built, then maybe bundle."""
+        await self.tree.setup_initial_selection(self.select_patterns)
+
         # Build initial bundle if no confirmation needed
         if not self.confirm_selection:
+            # Take the selection directly; the FileSelected message may not
+            # have been handled yet
+            self.selected_files = self.tree.selected_files.copy()
             self.rebuild_bundle()
 
     def setup_file_watcher(self) -> None:
@@ -278,14 +295,15 @@ class CodeBundlerApp(App):
         try:
             self.status_bar.update_status("Setting up file watcher...", "yellow")
             self.observer = watch_directory(
-                source_dir=str(self.watch_path),
+                source_dir=self._watch_str,
                 extension=self.extension,
                 ignore_names=self.ignore_names,
                 ignore_paths=self.ignore_paths,
                 include_names=self.include_names,
-                callback=lambda changed_file: self.call_later(
-                    self.on_file_changed, changed_file
+                callback=lambda changed_files: self.call_later(
+                    self.on_file_changed, changed_files
                 ),
+                output_file=self.output_file,
             )
             self.status_bar.update_status(
                 f"Watching {self.watch_path} for changes", "green"
@@ -294,16 +312,25 @@ class CodeBundlerApp(App):
             self.status_bar.update_status(f"Error setting up watcher: {e}", "red")
             logger.error(f"Error setting up file watcher: {e}")
 
-    def on_file_changed(self, changed_file: str) -> None:
+    def on_file_changed(self, changed_files: List[str]) -> None:
         """Handle file system change events."""
-        self.status_bar.update_status(f"File changed: {changed_file}", "yellow")
+        if len(changed_files) == 1:
+            message = f"File changed: {changed_files[0]}"
+        else:
+            message = f"{len(changed_files)} files changed"
+        self.status_bar.update_status(message, "yellow")
 
         # Update the tree to reflect file system changes
         self.tree.refresh_tree()
 
-        # Rebuild the bundle if the changed file is selected
-        file_path = str(Path(changed_file).resolve())
-        if file_path in self.selected_files:
+        # Rebuild the bundle if any changed file is selected. The watcher reports
+        # paths relative to the resolved root the tree was built from, so joining
+        # them back needs no filesystem lookups.
+        if any(
+            os.path.normpath(os.path.join(self._watch_str, changed_file))
+            in self.selected_files
+            for changed_file in changed_files
+        ):
             self.rebuild_bundle()
 
     def on_tree_node_highlighted(self, node):
@@ -342,46 +369,54 @@ class CodeBundlerApp(App):
             f"Bundling {len(self.selected_files)} files...", "yellow"
         )
 
+        self._bundle_generation += 1
+        generation = self._bundle_generation
+
         try:
-            # Convert absolute paths back to relative for the combiner
-            relative_paths = [
-                os.path.relpath(file_path, str(self.watch_path))
-                for file_path in self.selected_files
-            ]
-
-            # Create the bundle with our clean implementation
-            processed_count = create_bundle(
-                source_dir=str(self.watch_path),
-                output_file=self.output_file,
-                file_paths=list(self.selected_files),  # Use absolute paths
-                extension=self.extension,
-                remove_comments=self.strip_comments,
-                remove_docstrings=self.remove_docstrings,
+            # Run the file I/O off the event loop so the UI keeps rendering
+            loop = asyncio.get_running_loop()
+            stats = await loop.run_in_executor(
+                None, self._write_bundle, list(self.selected_files), generation
             )
 
+            # A newer rebuild has written, or will write, the latest selection
+            if stats is None:
+                return
+
             # Update status
             self.status_bar.update_status(
-                f"Bundle updated: {processed_count} files written to {self.output_file}",
+                f"Bundle updated: {stats.files} files written to {self.output_file}",
                 "green",
             )
 
-            # Get file stats
-            try:
-                with open(self.output_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-                    total_lines = content.count("\n") + 1
-                    total_size = len(content)
-
-                self.bundle_status.update(
-                    f"Bundle: {processed_count} files, {total_lines} lines, {total_size/1024:.1f} KB"
-                )
-            except Exception as e:
-                logger.error(f"Error reading output file stats: {e}")
+            self.bundle_status.update(
+                f"Bundle: {stats.files} files, {stats.lines} lines, {stats.bytes/1024:.1f} KB"
+            )
 
         except Exception as e:
             self.status_bar.update_status(f"Error creating bundle: {e}", "red")
             logger.error(f"Error creating bundle: {e}")
 
+    def _write_bundle(
+        self, file_paths: List[str], generation: int
+    ) -> Optional[CombineStats]:
+        """Write the bundle for the given absolute paths (runs in a thread).
+
+        Returns None without writing if a newer rebuild has started since.
+        """
+        with self._bundle_lock:
+            if generation != self._bundle_generation:
+                return None
+            return create_bundle(
+                source_dir=self._watch_str,
+                output_file=self.output_file,
+                file_paths=file_paths,
+                extension=self.extension,
+                remove_comments=self.strip_comments,
+                remove_docstrings=self.remove_docstrings,
+                cache=self._segment_cache,
+            )
+
     def action_rebuild(self) -> None:
         """Rebuild the bundle (triggered by key binding)."""
         self.rebuild_bundle()
@@ -2,14 +2,36 @@
 
 import logging
 import os
+import stat
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from codebundler.core.transformers import apply_transformations, get_comment_prefix
+from codebundler.core.transformers import apply_transformations
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class CombineStats:
+    """Counters collected while writing a bundle."""
+
+    files: int = 0
+    lines: int = 0
+    bytes: int = 0
+
+
+# Maps an absolute path to (signature, encoded segment, line count)
+SegmentCache = Dict[str, Tuple[tuple, bytes, int]]
+
+
+def _encode(text: str) -> bytes:
+    """Encode text for the binary output, translating newlines like text mode."""
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    return text.encode("utf-8")
+
+
 def create_bundle(
     source_dir: str,
     output_file: str,
@@ -17,7 +39,8 @@ def create_bundle(
     extension: str = None,  # Not used for filtering anymore, just for comment style
     remove_comments: bool = False,
     remove_docstrings: bool = False,
-) -> int:
+    cache: Optional[SegmentCache] = None,
+) -> CombineStats:
     """
     Combine selected files into a single bundle.
 
@@ -28,32 +51,71 @@ def create_bundle(
         extension: File extension to use for comment formatting
         remove_comments: Whether to remove comments
         remove_docstrings: Whether to remove docstrings
+        cache: Optional dict of encoded file segments, reused across calls
+            for files whose size and modification time have not changed
 
     Returns:
-        Number of files processed
+        Number of files processed and lines/bytes written
     """
     # Default comment prefix (used for the bundle header)
     default_comment = "#"
-    processed_count = 0
+    stats = CombineStats()
 
     # Create output directory if it doesn't exist
     output_path = Path(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_file, "w", encoding="utf-8") as outfile:
-        outfile.write(f"{default_comment} Files combined from: {source_dir}\n\n")
+    # A large buffer batches the many small segment writes
+    with open(output_file, "wb", buffering=1 << 20) as outfile:
+        outfile.write(
+            _encode(f"{default_comment} Files combined from: {source_dir}\n\n")
+        )
+        stats.lines += 2
 
         for abs_path in file_paths:
             # Convert to relative path for better readability in the output
             rel_path = os.path.relpath(abs_path, source_dir)
 
+            try:
+                st = os.stat(abs_path)
+            except OSError as e:
+                logger.warning(f"Error reading file {abs_path}: {e}")
+                continue
+
+            # The same stat tells us whether opening the path makes sense
+            if not stat.S_ISREG(st.st_mode):
+                logger.warning(f"Not a regular file, skipping: {abs_path}")
+                continue
+
+            # Reuse the previous segment if the file and options are unchanged
+            signature = (
+                st.st_mtime_ns,
+                st.st_size,
+                rel_path,
+                remove_comments,
+                remove_docstrings,
+            )
+            if cache is not None:
+                cached = cache.get(abs_path)
+                if cached is not None and cached[0] == signature:
+                    outfile.write(cached[1])
+                    stats.files += 1
+                    stats.lines += cached[2]
+                    continue
+
             # Detect file extension for this specific file
             file_ext = Path(abs_path).suffix
-            file_comment_prefix = get_comment_prefix(file_ext)
+
+            # Only transform files with extensions, and only if asked to
+            transform = bool(file_ext) and (remove_comments or remove_docstrings)
 
             try:
                 with open(abs_path, "r", encoding="utf-8") as infile:
-                    lines = infile.readlines()
+                    if transform:
+                        lines = infile.readlines()
+                    else:
+                        # Nothing to transform, so keep the file as one chunk
+                        lines = [infile.read()]
             except UnicodeDecodeError:
                 logger.warning(f"Could not read file as UTF-8: {abs_path}")
                 continue
@@ -62,7 +124,7 @@ def create_bundle(
                 continue
 
             # Apply transformations if requested, using the file's own extension
-            if file_ext:  # Only transform files with extensions
+            if transform:
                 lines = apply_transformations(
                     lines,
                     file_ext,
@@ -70,14 +132,27 @@ def create_bundle(
                     remove_docstrings=remove_docstrings,
                 )
 
-            # Add file header and footer
-            header = f"{default_comment} ==== BEGIN FILE: {rel_path} ====\n"
-            footer = f"\n{default_comment} ==== END FILE: {rel_path} ====\n\n"
-
-            outfile.write(header)
-            outfile.writelines(lines)
-            outfile.write(footer)
-            processed_count += 1
+            # Wrap the body in the file header and footer
+            segment = (
+                f"{default_comment} ==== BEGIN FILE: {rel_path} ====\n"
+                + "".join(lines)
+                + f"\n{default_comment} ==== END FILE: {rel_path} ====\n\n"
+            )
+            line_count = segment.count("\n")
+            data = _encode(segment)
+            if cache is not None:
+                cache[abs_path] = (signature, data, line_count)
+
+            outfile.write(data)
+            stats.files += 1
+            stats.lines += line_count
             logger.debug(f"Processed file: {rel_path}")
 
-    return processed_count
+        stats.bytes = outfile.tell()
+
+    # Drop segments of files that are no longer part of the bundle
+    if cache is not None:
+        for stale in cache.keys() - set(file_paths):
+            del cache[stale]
+
+    return stats
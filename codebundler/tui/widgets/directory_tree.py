@@ -1,10 +1,11 @@
 """Interactive directory tree widget for file selection."""
 
-import fnmatch
+import asyncio
 import logging
 import os
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from rich.text import Text
 from textual import on
@@ -12,12 +13,48 @@ from textual.message import Message
 from textual.widgets import Tree
 from textual.widgets.tree import TreeNode
 
+from codebundler.core.filters import compile_glob_matcher
+
 logger = logging.getLogger(__name__)
 
+# A scanned directory entry: (name, path, rel_path, is_dir, children)
+_Entry = Tuple[str, str, str, bool, list]
+
+
+def _match_patterns(
+    candidates: List[Tuple[str, str]], patterns: List[str]
+) -> List[str]:
+    """Return the paths whose relative path matches any of the glob patterns.
+
+    Args:
+        candidates: (path, rel_path) pairs to test
+        patterns: List of glob patterns to match
+
+    Returns:
+        Paths of the matching candidates
+    """
+    select_re = compile_glob_matcher(patterns)
+    return [
+        path
+        for path, rel_path in candidates
+        if select_re.match(os.path.normcase(rel_path))
+    ]
+
 
 class DirectoryTree(Tree):
     """A tree widget for navigating and selecting files in a directory structure."""
 
+    # Nodes added per event loop turn while building the initial tree
+    _INSERT_BATCH = 500
+
+    # Label prefixes keyed by (is_selected, is_dir), copied for each label
+    _LABEL_PREFIXES = {
+        (True, True): Text("✓ 📁 ", style="green"),
+        (True, False): Text("✓ 📄 ", style="green"),
+        (False, True): Text("  📁 "),
+        (False, False): Text("  📄 "),
+    }
+
     class FileSelected(Message):
         """Message sent when file selection changes."""
 
@@ -55,16 +92,29 @@ class DirectoryTree(Tree):
         self.extension = extension
         self.hide_patterns = hide_patterns or []
         self.select_patterns = select_patterns or []
+        # One compiled regex for all hide patterns instead of a fnmatch per pattern
+        self._hide_re = compile_glob_matcher(self.hide_patterns)
         self.selected_files: Set[str] = set()
         self.file_nodes: Dict[str, TreeNode] = {}
 
+        # Set once the initial directory scan has been added to the tree
+        self._populated = asyncio.Event()
+
+        # Set when a refresh is requested while the initial scan is being added
+        # or another refresh is running; the running one then scans again
+        self._refresh_pending = False
+        self._refreshing = False
+
+        # Pending timer for a coalesced FileSelected post
+        self._notify_timer = None
+
         # Initialize trackers for key press handling
         self._last_key_press = None
         self._highlighted_node = None
 
         # ID is already set by super().__init__ through kwargs
 
-    def on_mount(self) -> None:
+    async def on_mount(self) -> None:
         """Initialize the tree after the widget is mounted."""
         # Create the root node
         root_node = self.root.add(
@@ -72,96 +122,227 @@ class DirectoryTree(Tree):
             data={"path": str(self.root_directory), "is_dir": True, "selected": False},
         )
 
-        # Populate the tree
-        self.populate_tree(root_node, self.root_directory)
-
+        # Scan the directory on a worker thread so large trees don't block the UI,
+        # then build the nodes back on the event loop
+        loop = asyncio.get_running_loop()
+        entries = await loop.run_in_executor(
+            None, self._collect_tree, self.root_directory
+        )
         # Expand the root node
         root_node.expand()
 
-    def populate_tree(self, parent: TreeNode, directory: Path) -> None:
-        """Recursively populate the tree with nodes for files and directories.
+        # Add nodes top level first, yielding to the event loop between batches
+        # so a large tree fills in while the UI keeps responding
+        for count, _ in enumerate(self._iter_apply_tree(root_node, entries), 1):
+            if count % self._INSERT_BATCH == 0:
+                await asyncio.sleep(0)
+        self._populated.set()
+
+        # The scan may predate changes reported while the nodes were added
+        if self._refresh_pending:
+            self.refresh_tree()
+
+    def _collect_tree(
+        self, directory: Union[str, Path], rel_dir: str = ""
+    ) -> List[_Entry]:
+        """Scan a directory tree without touching any widgets.
+
+        Safe to run off the event loop.
 
         Args:
-            parent: Parent node to populate under
             directory: Directory to scan
+            rel_dir: Path of directory relative to the root, using "/"
+
+        Returns:
+            Sorted (name, path, rel_path, is_dir, children) entries for visible paths
         """
-        try:
+        collected = []
+        # Each item is a directory to scan and the list its entries go into
+        stack = [(directory, rel_dir, collected)]
+        hide_re = self._hide_re
+        while stack:
+            directory, rel_dir, out = stack.pop()
+            try:
+                # scandir hands back the entry type with the listing, so checking
+                # for directories usually costs no extra stat per entry
+                entries = []
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        # Skip hidden files and directories that start with .
+                        if entry.name.startswith("."):
+                            continue
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        entries.append((is_dir, entry))
+            except (PermissionError, FileNotFoundError) as e:
+                logger.error(f"Error accessing directory {directory}: {e}")
+                continue
+
             # Sort directories first, then files
-            paths = sorted(
-                list(directory.iterdir()),
-                key=lambda p: (not p.is_dir(), p.name.lower()),
-            )
+            entries.sort(key=lambda item: (not item[0], item[1].name.lower()))
 
-            for path in paths:
-                # Skip hidden files and directories that start with .
-                if path.name.startswith("."):
-                    continue
+            for is_dir, entry in entries:
+                name = entry.name
+                rel_path = f"{rel_dir}/{name}" if rel_dir else name
 
-                # Skip paths that match hide patterns
-                if any(
-                    fnmatch.fnmatch(path.name, pattern)
-                    for pattern in self.hide_patterns
-                ):
-                    continue
+                if hide_re is not None:
+                    # Skip paths that match hide patterns
+                    if hide_re.match(os.path.normcase(name)):
+                        continue
 
-                is_dir = path.is_dir()
-                rel_path = str(path.relative_to(self.root_directory))
+                    # Skip directories that match hide patterns
+                    if is_dir and hide_re.match(os.path.normcase(f"{rel_path}/")):
+                        continue
 
-                # Skip directories that match hide patterns
-                if is_dir and any(
-                    fnmatch.fnmatch(f"{rel_path}/", pattern)
-                    for pattern in self.hide_patterns
-                ):
-                    continue
+                children = []
+                out.append((name, entry.path, rel_path, is_dir, children))
 
-                # Include all files for selection - no extension filtering
-                is_matching_file = True
+                # Scan directories later, filling in their children list
+                if is_dir:
+                    stack.append((entry.path, rel_path, children))
 
-                # Show all files and allow selection of any file type
+        return collected
 
-                # Create the label with appropriate icon
-                if is_dir:
-                    icon = "📁 "
-                    label = Text(f"{icon}{path.name}")
-                else:
-                    icon = "📄 "
-                    label = Text(f"{icon}{path.name}")
+    def _apply_tree(self, parent: TreeNode, collected: List[_Entry]) -> None:
+        """Add nodes for entries gathered by _collect_tree under parent.
 
-                # Create the node - all files are selectable now
-                if is_dir:
-                    # Directories can be expanded
-                    node = parent.add(
-                        label,
-                        data={
-                            "path": str(path),
-                            "is_dir": is_dir,
-                            "selected": False,
-                            "selectable": True,
-                        },
-                    )
-                else:
-                    # Files can't be expanded, so set allow_expand=False to hide the arrow
-                    node = parent.add(
-                        label,
-                        data={
-                            "path": str(path),
-                            "is_dir": is_dir,
-                            "selected": False,
-                            "selectable": True,
-                        },
-                        allow_expand=False,  # No expansion arrows for files
-                    )
+        Args:
+            parent: Parent node to populate under
+            collected: Entries returned by _collect_tree
+        """
+        for _ in self._iter_apply_tree(parent, collected):
+            pass
 
-                # Store file nodes for later lookup - track all files
-                if not is_dir:
-                    self.file_nodes[str(path)] = node
+    def _iter_apply_tree(
+        self, parent: TreeNode, collected: List[_Entry]
+    ) -> Iterator[TreeNode]:
+        """Add nodes for collected entries level by level, yielding each new node.
+
+        Args:
+            parent: Parent node to populate under
+            collected: Entries returned by _collect_tree
+
+        Yields:
+            Each node as it is added
+        """
+        queue = deque([(parent, collected)])
+        while queue:
+            parent, collected = queue.popleft()
+            for entry in collected:
+                node = self._add_entry(parent, entry)
+                # Populate directories once their own node exists
+                if entry[3]:
+                    queue.append((node, entry[4]))
+                yield node
+
+    def _add_entry(
+        self,
+        parent: TreeNode,
+        entry: _Entry,
+        before: Optional[int] = None,
+    ) -> TreeNode:
+        """Add a node for one collected entry, without its children.
+
+        Args:
+            parent: Parent node to add under
+            entry: (name, path, rel_path, is_dir, children) tuple from _collect_tree
+            before: Child index to insert at, or None to append
+
+        Returns:
+            The new node
+        """
+        name, path, rel_path, is_dir, _ = entry
+
+        # Create the label with appropriate icon
+        if is_dir:
+            icon = "📁 "
+            label = Text(f"{icon}{name}")
+        else:
+            icon = "📄 "
+            label = Text(f"{icon}{name}")
+
+        # Create the node - all files are selectable now
+        if is_dir:
+            # Directories can be expanded
+            node = parent.add(
+                label,
+                data={
+                    "name": name,
+                    "path": path,
+                    "rel_path": rel_path,
+                    "is_dir": is_dir,
+                    "selected": False,
+                    "selectable": True,
+                },
+                before=before,
+            )
+        else:
+            # Files can't be expanded, so set allow_expand=False to hide the arrow
+            node = parent.add(
+                label,
+                data={
+                    "name": name,
+                    "path": path,
+                    "rel_path": rel_path,
+                    "is_dir": is_dir,
+                    "selected": False,
+                    "selectable": True,
+                },
+                before=before,
+                allow_expand=False,  # No expansion arrows for files
+            )
 
-                # Recursively populate directories
+        # Store file nodes for later lookup - track all files
+        if not is_dir:
+            self.file_nodes[path] = node
+
+        return node
+
+    def _sync_tree(self, parent: TreeNode, collected: List[_Entry]) -> None:
+        """Update parent's children in place to match a fresh scan.
+
+        Nodes for paths that still exist are kept, with their selection and
+        expansion state; only vanished entries are removed and new ones added.
+
+        Args:
+            parent: Parent node whose children to update
+            collected: Entries returned by _collect_tree for parent's directory
+        """
+        stack = [(parent, collected)]
+        while stack:
+            parent, collected = stack.pop()
+            existing = {
+                child.data["path"]: child for child in parent.children if child.data
+            }
+            wanted = {path: is_dir for _, path, _, is_dir, _ in collected}
+
+            # Drop nodes whose path is gone or changed between file and directory
+            for path, child in existing.items():
+                if wanted.get(path) != child.data["is_dir"]:
+                    self._forget_node(child)
+                    child.remove()
+
+            # Kept children stay in sorted order, so each new entry goes at its index
+            for index, entry in enumerate(collected):
+                _, path, _, is_dir, children = entry
+                child = existing.get(path)
+                if child is not None and child.data["is_dir"] == is_dir:
+                    if is_dir:
+                        stack.append((child, children))
+                    continue
+                before = index if index < len(parent.children) else None
+                node = self._add_entry(parent, entry, before=before)
                 if is_dir:
-                    self.populate_tree(node, path)
+                    self._apply_tree(node, children)
 
-        except (PermissionError, FileNotFoundError) as e:
-            logger.error(f"Error accessing directory {directory}: {e}")
+    def _forget_node(self, node: TreeNode) -> None:
+        """Drop a node's files from the lookup and selection before removal."""
+        for child in self.walk_tree(node):
+            if child.data:
+                self.file_nodes.pop(child.data["path"], None)
+                self.selected_files.discard(child.data["path"])
 
     async def setup_initial_selection(self, patterns: List[str]) -> None:
         """Set up initial file selection based on patterns.
@@ -172,74 +353,70 @@ class DirectoryTree(Tree):
         if not patterns:
             return
 
-        for file_path, node in self.file_nodes.items():
-            rel_path = os.path.relpath(file_path, str(self.root_directory))
-            if any(fnmatch.fnmatch(rel_path, pattern) for pattern in patterns):
-                node.data["selected"] = True
-                self.selected_files.add(file_path)
-                node.label = self._get_label_with_selection(node)
-
-        # Notify about selection
-        self.post_message(self.FileSelected(self.selected_files.copy()))
-
-    def refresh_tree(self) -> None:
-        """Refresh the tree to reflect file system changes."""
-        # Save the current selection and expansion state
-        selected_files = self.selected_files.copy()
-        expanded_nodes = {
-            node.data["path"]
-            for node in self.walk_tree()
-            if hasattr(node, "is_expanded")
-            and node.is_expanded
-            and node.data.get("is_dir", False)
-        }
-
-        # Clear and rebuild the tree
-        self.root.remove_children()
-        self.file_nodes.clear()
-        self.selected_files.clear()
-
-        # Recreate the root node
-        root_node = self.root.add(
-            str(self.root_directory.name),
-            data={"path": str(self.root_directory), "is_dir": True, "selected": False},
+        # Wait for the initial scan so there are file nodes to match against
+        await self._populated.wait()
+
+        # Match on a worker thread, then update the matching nodes here
+        candidates = [
+            (file_path, node.data["rel_path"])
+            for file_path, node in self.file_nodes.items()
+        ]
+        loop = asyncio.get_running_loop()
+        matched = await loop.run_in_executor(
+            None, _match_patterns, candidates, patterns
         )
 
-        # Repopulate
-        self.populate_tree(root_node, self.root_directory)
-
-        # Restore selection state
-        for file_path in selected_files:
-            if file_path in self.file_nodes:
-                node = self.file_nodes[file_path]
+        with self.app.batch_update():
+            for file_path in matched:
+                # The tree may have been refreshed while matching ran
+                node = self.file_nodes.get(file_path)
+                if node is None:
+                    continue
                 node.data["selected"] = True
                 self.selected_files.add(file_path)
                 node.label = self._get_label_with_selection(node)
 
-        # Restore expansion state
-        for node in self.walk_tree():
-            if (
-                node.data.get("is_dir", False)
-                and node.data["path"] in expanded_nodes
-                and hasattr(node, "expand")
-            ):
-                node.expand()
-
         # Notify about selection
         self.post_message(self.FileSelected(self.selected_files.copy()))
 
-    def walk_tree(self):
-        """Walk through all nodes in the tree."""
-        yield self.root
-        if hasattr(self.root, "children"):
-            yield from self._walk_node(self.root)
-
-    def _walk_node(self, node):
-        """Recursively walk through a node's children."""
-        if hasattr(node, "children"):
-            for child in node.children:
-                yield child
-                yield from self._walk_node(child)
+    def refresh_tree(self) -> None:
+        """Refresh the tree to reflect file system changes."""
+        # Overlapping requests collapse into one more pass of the running refresh;
+        # before the initial scan is added, on_mount replays the request
+        self._refresh_pending = True
+        if self._populated.is_set() and not self._refreshing:
+            self._refreshing = True
+            self.run_worker(self._run_refresh(), group="refresh")
+
+    async def _run_refresh(self) -> None:
+        """Rescan in the background until no further refresh is pending."""
+        loop = asyncio.get_running_loop()
+        try:
+            while self._refresh_pending:
+                self._refresh_pending = False
+                collected = await loop.run_in_executor(
+                    None, self._collect_tree, self.root_directory
+                )
+
+                # Update the existing nodes in place, which keeps the selection
+                # and expansion state of everything that still exists
+                root_node = self.root.children[0]
+                with self.app.batch_update():
+                    self._sync_tree(root_node, collected)
+
+                # Notify about selection
+                self.post_message(self.FileSelected(self.selected_files.copy()))
+        finally:
+            self._refreshing = False
+
+    def walk_tree(self, node: Optional[TreeNode] = None):
+        """Walk through all nodes in the tree, or under node, in display order."""
+        stack = [self.root if node is None else node]
+        while stack:
+            node = stack.pop()
+            yield node
+            # Push children reversed so they pop in display order
+            stack.extend(reversed(node.children))
 
     def _get_label_with_selection(self, node: TreeNode) -> Text:
         """Get the node label with selection indicator."""
@@ -248,26 +425,20 @@ class DirectoryTree(Tree):
             return node.label if hasattr(node, "label") else Text(str(node))
 
         try:
-            path = Path(node.data.get("path", "unknown"))
             is_dir = node.data.get("is_dir", False)
             is_selected = node.data.get("selected", False)
+            name = node.data.get("name")
+            if name is None:
+                name = os.path.basename(node.data.get("path", "unknown"))
 
-            # Create a simple label without rich text markup
+            # Copy the shared prefix rather than building a styled Text each time
+            label = self._LABEL_PREFIXES[(is_selected, is_dir)].copy()
             if is_selected:
-                if is_dir:
-                    label = Text("✓ 📁 ", style="green")
-                else:
-                    label = Text("✓ 📄 ", style="green")
                 # Add the name in green
-                label.append(path.name, style="green bold")
+                label.append(name, style="green bold")
             else:
-                # Unselected items
-                if is_dir:
-                    label = Text("  📁 ")
-                else:
-                    label = Text("  📄 ")
                 # Add the name normally
-                label.append(path.name)
+                label.append(name)
 
             return label
         except Exception as e:
@@ -300,8 +471,9 @@ class DirectoryTree(Tree):
                 # Toggle based on current selection state
                 is_selected = not has_selected_children
 
-                # Toggle selection for all child files
-                self._select_node_children(node, is_selected)
+                # Toggle selection for all child files, repainting once at the end
+                with self.app.batch_update():
+                    self._select_node_children(node, is_selected)
 
                 # For empty directories or directories with only subdirectories (no files)
                 # we need to handle them specially to ensure they can be toggled
@@ -333,25 +505,43 @@ class DirectoryTree(Tree):
                 # Update node label to reflect selection state
                 node.label = self._get_label_with_selection(node)
 
-            # Notify about selection change
-            self.post_message(self.FileSelected(self.selected_files.copy()))
+            # Notify about selection change, coalescing rapid toggles
+            self._schedule_notify()
         except Exception as e:
             self.log(f"Error toggling selection: {e}")
 
+    def _schedule_notify(self) -> None:
+        """Post one FileSelected per frame, however fast toggles arrive."""
+        if self._notify_timer is None:
+            self._notify_timer = self.set_timer(1 / 60, self._flush_notify)
+
+    def _flush_notify(self) -> None:
+        """Post the current selection once the coalescing window ends."""
+        self._notify_timer = None
+        self.post_message(self.FileSelected(self.selected_files.copy()))
+
     def select_all_matching_files(self) -> None:
         """Select all files matching the extension filter."""
-        for file_path, node in self.file_nodes.items():
-            node.data["selected"] = True
-            self.selected_files.add(file_path)
-            node.label = self._get_label_with_selection(node)
+        with self.app.batch_update():
+            for file_path, node in self.file_nodes.items():
+                # Already-selected nodes have the right label
+                if node.data["selected"]:
+                    continue
+                node.data["selected"] = True
+                self.selected_files.add(file_path)
+                node.label = self._get_label_with_selection(node)
 
         self.post_message(self.FileSelected(self.selected_files.copy()))
 
     def deselect_all_files(self) -> None:
         """Deselect all files in the tree."""
-        for file_path, node in self.file_nodes.items():
-            node.data["selected"] = False
-            node.label = self._get_label_with_selection(node)
+        with self.app.batch_update():
+            for node in self.file_nodes.values():
+                # Unselected nodes have the right label
+                if not node.data["selected"]:
+                    continue
+                node.data["selected"] = False
+                node.label = self._get_label_with_selection(node)
 
         self.selected_files.clear()
         self.post_message(self.FileSelected(self.selected_files.copy()))
@@ -384,23 +574,26 @@ class DirectoryTree(Tree):
         if not hasattr(node, "children") or len(node.children) == 0:
             return path in self.selected_files
 
-        # For non-empty directories, check all children
-        if hasattr(node, "children"):
-            for child in node.children:
-                # Skip children without data
-                if not hasattr(child, "data") or child.data is None:
-                    continue
+        # For non-empty directories, check all descendants, stopping at the first hit
+        stack = list(node.children)
+        while stack:
+            child = stack.pop()
 
-                if child.data.get("is_dir", False):
-                    if self._any_child_selected(child):
-                        return True
-                elif child.data.get("selected", False):
+            # Skip children without data
+            if not hasattr(child, "data") or child.data is None:
+                continue
+
+            if child.data.get("is_dir", False):
+                if child.data.get("path", "") in self.selected_files:
                     return True
+                stack.extend(child.children)
+            elif child.data.get("selected", False):
+                return True
 
         return False
 
     def _select_node_children(self, node: TreeNode, select: bool) -> None:
-        """Recursively select or deselect all file children of a node.
+        """Select or deselect all file descendants of a node.
 
         Args:
             node: The parent node
@@ -417,18 +610,21 @@ class DirectoryTree(Tree):
                     self.selected_files.discard(dir_path)
             return
 
-        # Handle children
-        for child in node.children:
+        # Handle all descendants with an explicit stack
+        stack = list(node.children)
+        while stack:
+            child = stack.pop()
+
             # Skip children without data
             if not hasattr(child, "data") or child.data is None:
                 continue
 
             try:
-                # First update this child node's selection state
-                child.data["selected"] = select
-
-                # Update node label to reflect selection state
-                child.label = self._get_label_with_selection(child)
+                # First update this child node's selection state, relabelling
+                # only if it changed
+                if child.data.get("selected", False) != select:
+                    child.data["selected"] = select
+                    child.label = self._get_label_with_selection(child)
 
                 if child.data.get("is_dir", False):
                     # Check if this directory is empty
@@ -445,8 +641,8 @@ class DirectoryTree(Tree):
                             else:
                                 self.selected_files.discard(dir_path)
                     else:
-                        # Recursively update all its children
-                        self._select_node_children(child, select)
+                        # Update all its children too
+                        stack.extend(child.children)
                 else:
                     # This is a file - add/remove from selection set
                     path = child.data.get("path", "")
@@ -471,8 +667,8 @@ class DirectoryTree(Tree):
 
                 if node_line is not None:
                     # Clear cached nodes to ensure we get fresh data
-                    if hasattr(self, "_tree_nodes"):
-                        delattr(self, "_tree_nodes")
+                    if hasattr(self, "_visible_nodes"):
+                        delattr(self, "_visible_nodes")
 
                     # Get all visible nodes
                     nodes = list(self.nodes)
@@ -496,8 +692,8 @@ class DirectoryTree(Tree):
                                         await clicked_node.expand()
 
                                 # Clear the cache again after expansion changes
-                                if hasattr(self, "_tree_nodes"):
-                                    delattr(self, "_tree_nodes")
+                                if hasattr(self, "_visible_nodes"):
+                                    delattr(self, "_visible_nodes")
                             else:
                                 # For files, toggle selection
                                 event.prevent_default()  # Prevent default behavior
@@ -511,26 +707,21 @@ class DirectoryTree(Tree):
     @property
     def nodes(self):
         """Get all visible nodes in the tree."""
-        if hasattr(self, "_tree_nodes"):
-            return self._tree_nodes
+        if hasattr(self, "_visible_nodes"):
+            return self._visible_nodes
 
         nodes = []
 
-        def collect_visible_nodes(node):
+        # Explicit stack so deeply expanded trees don't hit the recursion limit;
+        # children are pushed reversed so they pop in display order
+        stack = list(reversed(self.root.children))
+        while stack:
+            node = stack.pop()
             nodes.append(node)
-            if (
-                hasattr(node, "is_expanded")
-                and node.is_expanded
-                and hasattr(node, "children")
-            ):
-                for child in node.children:
-                    collect_visible_nodes(child)
-
-        if hasattr(self.root, "children"):
-            for child in self.root.children:
-                collect_visible_nodes(child)
-
-        self._tree_nodes = nodes
+            if node.is_expanded:
+                stack.extend(reversed(node.children))
+
+        self._visible_nodes = nodes
         return nodes
 
     # Keep this for handling keyboard selection
@@ -549,15 +740,15 @@ class DirectoryTree(Tree):
     def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
         """Handle node expansion events."""
         # Clear the nodes cache since the tree structure changed
-        if hasattr(self, "_tree_nodes"):
-            delattr(self, "_tree_nodes")
+        if hasattr(self, "_visible_nodes"):
+            delattr(self, "_visible_nodes")
 
     @on(Tree.NodeCollapsed)
     def on_tree_node_collapsed(self, event: Tree.NodeCollapsed) -> None:
         """Handle node collapse events."""
         # Clear the nodes cache since the tree structure changed
-        if hasattr(self, "_tree_nodes"):
-            delattr(self, "_tree_nodes")
+        if hasattr(self, "_visible_nodes"):
+            delattr(self, "_visible_nodes")
 
     async def on_key(self, event) -> None:
         """Handle key press events for the tree."""
@@ -576,8 +767,8 @@ class DirectoryTree(Tree):
                 self.toggle_selection(node)
 
                 # Clear cached nodes to ensure we have the latest state
-                if hasattr(self, "_tree_nodes"):
-                    delattr(self, "_tree_nodes")
+                if hasattr(self, "_visible_nodes"):
+                    delattr(self, "_visible_nodes")
 
             # Handle enter key for selection ONLY (never expands/collapses)
             elif event.key == "enter":
@@ -2,17 +2,32 @@
 
 import logging
 import os
-import time
+import threading
 from pathlib import Path
-from typing import Callable, List
+from typing import Callable, List, Optional, Union
 
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
 
-from codebundler.core.filters import should_ignore, should_include
+from codebundler.core.filters import compile_keyword_matcher
 
 logger = logging.getLogger(__name__)
 
+# Access-only events (newer watchdog on Linux) that never change file contents
+_READ_ONLY_EVENTS = frozenset({"opened", "closed_no_write"})
+
+
+class _WatchObserver(Observer):
+    """Observer that also stops its handler's debounce worker when stopped."""
+
+    def __init__(self, handler: "CodeBundlerHandler"):
+        super().__init__()
+        self._handler = handler
+
+    def on_thread_stop(self) -> None:
+        super().on_thread_stop()
+        self._handler.stop()
+
 
 class CodeBundlerHandler(FileSystemEventHandler):
     """Event handler for file system changes."""
@@ -20,77 +35,154 @@ class CodeBundlerHandler(FileSystemEventHandler):
     def __init__(
         self,
         source_dir: str,
-        extension: str,
+        extension: Union[str, List[str]],
         ignore_names: List[str] = None,
         ignore_paths: List[str] = None,
         include_names: List[str] = None,
-        callback: Callable[[str], None] = None,
+        callback: Callable[[List[str]], None] = None,
+        output_file: Optional[str] = None,
     ):
         """Initialize the handler with filters and callback."""
         self.source_dir = source_dir
         self.extension = extension
+        # Suffixes as a tuple so one str.endswith call checks them all
+        if isinstance(extension, str):
+            self._extensions = (extension,)
+        else:
+            self._extensions = tuple(extension or ())
         self.ignore_names = ignore_names or []
         self.ignore_paths = ignore_paths or []
         self.include_names = include_names or []
+        # Keyword lists compiled once so each event is a single regex search
+        self._ignore_name_re = compile_keyword_matcher(self.ignore_names)
+        self._ignore_path_re = compile_keyword_matcher(self.ignore_paths)
+        self._include_name_re = compile_keyword_matcher(self.include_names)
         # No tree-based selection parameters needed
         self.callback = callback
-        self.last_run = 0
         self.debounce_time = 0.5  # seconds
-        self.last_changed_file = None
+        self.last_changed_files: List[str] = []
+
+        # Absolute source root with a trailing separator, for cheap relative paths
+        self._source_prefix = os.path.join(os.path.abspath(source_dir), "")
+
+        # Resolved once so our own bundle writes are skipped with a string compare
+        self._output_path = os.path.realpath(output_file) if output_file else None
+
+        # Events are queued here and handled in bursts by the debounce worker
+        self._pending_paths: List[str] = []
+        self._pending_lock = threading.Lock()
+        self._pending = threading.Event()
+        self._stopped = threading.Event()
+        self._worker = threading.Thread(target=self._process_pending, daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        """Stop the debounce worker, dropping any events not yet reported."""
+        self._stopped.set()
+        # Wake the worker if it is waiting for events
+        self._pending.set()
+        if threading.current_thread() is not self._worker:
+            self._worker.join()
 
     def on_any_event(self, event: FileSystemEvent) -> None:
         """Handle file system events."""
-        if event.is_directory:
-            return
-
-        # Skip non-matching files
-        if not event.src_path.endswith(self.extension):
+        if event.is_directory or event.event_type in _READ_ONLY_EVENTS:
             return
 
-        # Apply filtering logic
-        filename = os.path.basename(event.src_path)
-        rel_path = os.path.relpath(event.src_path, self.source_dir)
-        rel_path = rel_path.replace("\\", "/")
+        # Some watchdog backends report bytes paths
+        src_path = os.fsdecode(event.src_path)
 
-        if should_ignore(filename, rel_path, self.ignore_names, self.ignore_paths):
-            return
-        if not should_include(filename, self.include_names):
+        # Skip non-matching files; filtering and debouncing happen in the worker
+        if self._extensions and not src_path.endswith(self._extensions):
             return
 
-        # Apply TUI-specific selection logic
-
-        # Debounce to prevent multiple rapid rebuilds
-        current_time = time.time()
-        if current_time - self.last_run < self.debounce_time:
+        # Writing the bundle must not trigger another rebuild
+        if src_path == self._output_path:
             return
 
-        # Store the changed file path and trigger callback
-        self.last_changed_file = rel_path
-        self.last_run = current_time
-        logger.info(f"File changed: {self.last_changed_file}")
+        with self._pending_lock:
+            self._pending_paths.append(src_path)
+        self._pending.set()
+
+    def _process_pending(self) -> None:
+        """Wait for event bursts to settle and report each burst's paths once."""
+        while not self._stopped.is_set():
+            self._pending.wait()
+
+            # Debounce to prevent multiple rapid rebuilds; stop() cuts this short
+            if self._stopped.wait(self.debounce_time):
+                return
+            self._pending.clear()
+
+            with self._pending_lock:
+                paths, self._pending_paths = self._pending_paths, []
+
+            # Every path that passes the filters, once each, in event order
+            changed_files = list(
+                dict.fromkeys(
+                    rel_path
+                    for rel_path in map(self._filter_path, paths)
+                    if rel_path is not None
+                )
+            )
+            if not changed_files:
+                continue
+
+            # Store the changed file paths and trigger callback
+            self.last_changed_files = changed_files
+            logger.info(f"Files changed: {', '.join(changed_files)}")
+
+            if self.callback and not self._stopped.is_set():
+                self.callback(changed_files)
+
+    def _filter_path(self, src_path: str) -> Optional[str]:
+        """
+        Apply the ignore/include filters to a changed path.
+
+        Args:
+            src_path: Path reported by the file system event
+
+        Returns:
+            The path relative to the source directory, or None if filtered out
+        """
+        filename = os.path.basename(src_path)
+        if src_path.startswith(self._source_prefix):
+            rel_path = src_path[len(self._source_prefix) :]
+        else:
+            rel_path = os.path.relpath(src_path, self.source_dir)
+        rel_path = rel_path.replace("\\", "/")
+
+        # Same rules as should_ignore/should_include, using the compiled lists
+        if self._ignore_name_re and self._ignore_name_re.search(filename):
+            return None
+        if self._ignore_path_re and self._ignore_path_re.search(rel_path):
+            return None
+        if self._include_name_re and not self._include_name_re.search(filename):
+            return None
 
-        if self.callback:
-            self.callback(self.last_changed_file)
+        return rel_path
 
 
 def watch_directory(
     source_dir: str,
-    extension: str,
+    extension: Union[str, List[str]],
     ignore_names: List[str] = None,
     ignore_paths: List[str] = None,
     include_names: List[str] = None,
-    callback: Callable[[str], None] = None,
+    callback: Callable[[List[str]], None] = None,
+    output_file: Optional[str] = None,
 ) -> Observer:
     """
     Watch a directory for changes and trigger the callback when files change.
 
     Args:
         source_dir: Directory to watch
-        extension: File extension to monitor
+        extension: File extension(s) to monitor
         ignore_names: List of filename patterns to ignore
         ignore_paths: List of path patterns to ignore
         include_names: List of filename patterns to include
-        callback: Function to call when changes are detected
+        callback: Function called with the relative paths changed in each burst
+        output_file: Bundle path to ignore, if it lies inside source_dir
 
     Returns:
         The observer object (call observer.stop() to stop watching)
@@ -102,9 +194,10 @@ def watch_directory(
         ignore_paths=ignore_paths,
         include_names=include_names,
         callback=callback,
+        output_file=output_file,
     )
 
-    observer = Observer()
+    observer = _WatchObserver(event_handler)
     observer.schedule(event_handler, source_dir, recursive=True)
     observer.start()
     return observer
@@ -0,0 +1,42 @@
+"""Tests for the TUI application."""
+
+import os
+import tempfile
+import unittest
+
+from codebundler.tui.app import CodeBundlerApp
+
+
+class TestApp(unittest.TestCase):
+    """Test cases for the TUI application."""
+
+    def setUp(self):
+        """Create a source file and an app that bundles it."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.source_dir = os.path.realpath(self.temp_dir.name)
+        self.source_file = os.path.join(self.source_dir, "a.py")
+        with open(self.source_file, "w") as f:
+            f.write("a = 1\n")
+        self.output_file = os.path.join(self.source_dir, "out", "bundle.txt")
+        self.app = CodeBundlerApp(
+            watch_path=self.source_dir, output_file=self.output_file
+        )
+
+    def tearDown(self):
+        """Clean up the source directory."""
+        self.temp_dir.cleanup()
+
+    def test_stale_bundle_write_is_skipped(self):
+        """Test that a write queued before a newer rebuild leaves the bundle alone."""
+        self.app._bundle_generation = 2
+
+        self.assertIsNone(self.app._write_bundle([self.source_file], 1))
+        self.assertFalse(os.path.exists(self.output_file))
+
+        stats = self.app._write_bundle([self.source_file], 2)
+        self.assertEqual(stats.files, 1)
+        self.assertTrue(os.path.exists(self.output_file))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ import os
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 from codebundler.tui.bundler import create_bundle
 
@@ -71,7 +72,7 @@ class TestBundler(unittest.TestCase):
 
         try:
             # Combine the files
-            file_count = create_bundle(
+            stats = create_bundle(
                 source_dir=str(self.source_dir),
                 output_file=output_path,
                 file_paths=self.all_files,
@@ -83,7 +84,7 @@ class TestBundler(unittest.TestCase):
             self.assertTrue(os.path.exists(output_path))
 
             # Check that we processed the expected number of files
-            self.assertEqual(file_count, 3)
+            self.assertEqual(stats.files, 3)
 
             # Read the output file and check its content
             with open(output_path, "r", encoding="utf-8") as f:
@@ -119,7 +120,7 @@ class TestBundler(unittest.TestCase):
 
         try:
             # Combine the files with transformations
-            file_count = create_bundle(
+            stats = create_bundle(
                 source_dir=str(self.source_dir),
                 output_file=output_path,
                 file_paths=self.all_files,
@@ -155,6 +156,143 @@ class TestBundler(unittest.TestCase):
             if os.path.exists(output_path):
                 os.unlink(output_path)
 
+    def test_create_bundle_stats_match_output(self):
+        """Test that returned line and byte counts describe the written file."""
+        # Create a temporary file for the output
+        with tempfile.NamedTemporaryFile(delete=False) as output_file:
+            output_path = output_file.name
+
+        try:
+            stats = create_bundle(
+                source_dir=str(self.source_dir),
+                output_file=output_path,
+                file_paths=self.all_files,
+                remove_comments=True,
+                remove_docstrings=True,
+            )
+
+            with open(output_path, "rb") as f:
+                content = f.read()
+
+            self.assertEqual(stats.files, 3)
+            self.assertEqual(stats.lines, content.count(b"\n"))
+            self.assertEqual(stats.bytes, len(content))
+
+        finally:
+            # Clean up
+            if os.path.exists(output_path):
+                os.unlink(output_path)
+
+    def test_create_bundle_uses_platform_line_endings(self):
+        """Test that newlines are written as os.linesep, as text mode would."""
+        # Create a temporary file for the output
+        with tempfile.NamedTemporaryFile(delete=False) as output_file:
+            output_path = output_file.name
+
+        try:
+            with mock.patch("os.linesep", "\r\n"):
+                stats = create_bundle(
+                    source_dir=str(self.source_dir),
+                    output_file=output_path,
+                    file_paths=self.all_files,
+                )
+
+            with open(output_path, "rb") as f:
+                content = f.read()
+
+            self.assertEqual(content.count(b"\n"), content.count(b"\r\n"))
+            self.assertEqual(stats.lines, content.count(b"\n"))
+            self.assertEqual(stats.bytes, len(content))
+
+        finally:
+            # Clean up
+            if os.path.exists(output_path):
+                os.unlink(output_path)
+
+    def test_create_bundle_reuses_cached_segments(self):
+        """Test that cached segments are reused until a file changes."""
+        # Create a temporary file for the output
+        with tempfile.NamedTemporaryFile(delete=False) as output_file:
+            output_path = output_file.name
+
+        try:
+            cache = {}
+            create_bundle(
+                source_dir=str(self.source_dir),
+                output_file=output_path,
+                file_paths=self.all_files,
+                remove_comments=True,
+                cache=cache,
+            )
+            self.assertEqual(set(cache), set(self.all_files))
+
+            with open(output_path, "rb") as f:
+                first = f.read()
+
+            # An unchanged tree produces the same bundle from the cache
+            stats = create_bundle(
+                source_dir=str(self.source_dir),
+                output_file=output_path,
+                file_paths=self.all_files,
+                remove_comments=True,
+                cache=cache,
+            )
+            with open(output_path, "rb") as f:
+                self.assertEqual(f.read(), first)
+            self.assertEqual(stats.bytes, len(first))
+
+            # Editing a file invalidates only its own segment
+            changed = self.all_files[0]
+            with open(changed, "a") as f:
+                f.write("changed_marker = 1\n")
+            st = os.stat(changed)
+            os.utime(changed, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+            create_bundle(
+                source_dir=str(self.source_dir),
+                output_file=output_path,
+                file_paths=self.all_files,
+                remove_comments=True,
+                cache=cache,
+            )
+            with open(output_path, "r") as f:
+                self.assertIn("changed_marker = 1", f.read())
+
+            # Files left out of the bundle are dropped from the cache
+            create_bundle(
+                source_dir=str(self.source_dir),
+                output_file=output_path,
+                file_paths=self.all_files[1:],
+                remove_comments=True,
+                cache=cache,
+            )
+            self.assertEqual(set(cache), set(self.all_files[1:]))
+
+        finally:
+            # Clean up
+            if os.path.exists(output_path):
+                os.unlink(output_path)
+
+    def test_create_bundle_skips_non_regular_files(self):
+        """Test that directories in the file list are skipped."""
+        # Create a temporary file for the output
+        with tempfile.NamedTemporaryFile(delete=False) as output_file:
+            output_path = output_file.name
+
+        try:
+            stats = create_bundle(
+                source_dir=str(self.source_dir),
+                output_file=output_path,
+                file_paths=[str(self.source_dir / "src")] + self.src_files,
+            )
+
+            self.assertEqual(stats.files, len(self.src_files))
+
+        finally:
+            # Clean up
+            if os.path.exists(output_path):
+                os.unlink(output_path)
+
     def test_create_bundle_subset_files(self):
         """Test bundling a subset of files."""
         # Create a temporary file for the output
@@ -163,7 +301,7 @@ class TestBundler(unittest.TestCase):
 
         try:
             # Combine only the src files
-            file_count = create_bundle(
+            stats = create_bundle(
                 source_dir=str(self.source_dir),
                 output_file=output_path,
                 file_paths=self.src_files,
@@ -175,7 +313,7 @@ class TestBundler(unittest.TestCase):
             self.assertTrue(os.path.exists(output_path))
 
             # Check that we processed the expected number of files
-            self.assertEqual(file_count, 2)
+            self.assertEqual(stats.files, 2)
 
             # Read the output file and check its content
             with open(output_path, "r", encoding="utf-8") as f:
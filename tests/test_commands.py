@@ -0,0 +1,213 @@
+"""Tests for the command line interface module."""
+
+import io
+import logging
+import logging.handlers
+import subprocess
+import sys
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from codebundler import __version__
+from codebundler.cli import commands
+from codebundler.cli.commands import (
+    RichLogHandler,
+    StdoutHandler,
+    _parse_fast,
+    configure_logging,
+    main,
+    setup_parser,
+    stop_log_listener,
+)
+
+
+class _Stdout(io.StringIO):
+    """Stand-in for sys.stdout that reports whether it is a terminal."""
+
+    def __init__(self, tty: bool) -> None:
+        super().__init__()
+        self.tty = tty
+
+    def isatty(self) -> bool:
+        return self.tty
+
+
+class TestCommands(unittest.TestCase):
+    """Test cases for the command line interface module."""
+
+    def test_parse_fast_matches_parser(self):
+        """Test that the fast path yields the same namespace as argparse."""
+        args = ["src", "bundle.txt"]
+        fast_args = _parse_fast(args)
+        parsed_args = setup_parser().parse_args(args)
+
+        self.assertIsNotNone(fast_args)
+        self.assertEqual(vars(fast_args), vars(parsed_args))
+
+    def test_parse_fast_matches_parser_with_options(self):
+        """Test that supported options parse the same as with argparse."""
+        cases = [
+            ["-vv", "src", "bundle.txt", "--verbose"],
+            ["src", "bundle.txt", "-y", "-q", "--strip-comments"],
+            ["--no-strip-comments", "--remove-docstrings", "src", "bundle.txt"],
+            ["src", "bundle.txt", "--no-remove-docstrings", "--yes", "--quiet"],
+            ["--select=*.py,*.md", "--ignore=__pycache__", "src", "bundle.txt"],
+            ["src", "bundle.txt", "--select="],
+        ]
+        parser = setup_parser()
+        for args in cases:
+            with self.subTest(args=args):
+                fast_args = _parse_fast(args)
+                self.assertIsNotNone(fast_args)
+                self.assertEqual(vars(fast_args), vars(parser.parse_args(args)))
+
+    def test_parse_fast_defers_to_parser(self):
+        """Test that forms needing argparse fall back to the full parser."""
+        self.assertIsNone(_parse_fast(["src"]))
+        self.assertIsNone(_parse_fast(["src", "bundle.txt", "extra"]))
+        self.assertIsNone(_parse_fast(["src", "bundle.txt", "-h"]))
+        self.assertIsNone(_parse_fast(["src", "bundle.txt", "--ignore"]))
+        self.assertIsNone(_parse_fast(["src", "bundle.txt", "--strip"]))
+        self.assertIsNone(_parse_fast(["src", "bundle.txt", "-yq"]))
+        self.assertIsNone(_parse_fast(["--", "src", "bundle.txt"]))
+
+    def test_stdout_handler_follows_redirected_stdout(self):
+        """Test that log records go to sys.stdout as it is when emitted."""
+        handler = StdoutHandler()
+        handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+        record = logging.LogRecord("x", logging.WARNING, "", 0, "moved", None, None)
+
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            handler.emit(record)
+
+        self.assertEqual(buffer.getvalue(), "WARNING: moved\n")
+
+    def configure(self, verbosity, tty=False):
+        """Run configure_logging, restoring the logging setup afterwards."""
+        root = logging.getLogger()
+        saved_handlers = root.handlers[:]
+        saved_level = root.level
+        saved_library_levels = {
+            name: logging.getLogger(name).level for name in commands._LIBRARY_LOGGERS
+        }
+
+        def restore():
+            stop_log_listener()
+            for handler in root.handlers[:]:
+                root.removeHandler(handler)
+            for handler in saved_handlers:
+                root.addHandler(handler)
+            root.setLevel(saved_level)
+            for name, level in saved_library_levels.items():
+                logging.getLogger(name).setLevel(level)
+
+        self.addCleanup(restore)
+        with mock.patch("sys.stdout", _Stdout(tty)):
+            configure_logging(verbosity)
+        return commands._log_listener
+
+    def test_configure_logging_replaces_previous_setup(self):
+        """Test that repeated calls leave one queue handler and one live listener."""
+        first = self.configure(1)
+        second = self.configure(2)
+
+        root = logging.getLogger()
+        self.assertEqual(len(root.handlers), 1)
+        self.assertIsInstance(root.handlers[0], logging.handlers.QueueHandler)
+        self.assertIs(root.handlers[0].queue, second.queue)
+        self.assertIsNot(first, second)
+        self.assertIsNone(first._thread)
+        self.assertTrue(second._thread.is_alive())
+        self.assertEqual(root.level, logging.INFO)
+
+    def test_configure_logging_chooses_handler(self):
+        """Test that Rich output is only used for debug verbosity on a terminal."""
+        for verbosity in range(5):
+            for tty in (False, True):
+                with self.subTest(verbosity=verbosity, tty=tty):
+                    (handler,) = self.configure(verbosity, tty).handlers
+                    if verbosity >= 3 and tty:
+                        self.assertIsInstance(handler, RichLogHandler)
+                        continue
+                    self.assertIsInstance(handler, StdoutHandler)
+                    if verbosity >= 3:
+                        self.assertIs(handler.formatter, commands._DETAILED_FORMATTER)
+                    else:
+                        self.assertIs(handler.formatter, commands._FORMATTER)
+
+    def test_configure_logging_sets_library_levels(self):
+        """Test that third-party loggers are quieted below debug verbosity."""
+        expected = {0: logging.ERROR, 1: logging.WARNING, 2: logging.WARNING}
+        for verbosity, level in expected.items():
+            with self.subTest(verbosity=verbosity):
+                self.configure(verbosity)
+                for name in commands._LIBRARY_LOGGERS:
+                    self.assertEqual(logging.getLogger(name).level, level)
+
+        # Debug verbosity leaves the library loggers alone
+        for name in commands._LIBRARY_LOGGERS:
+            logging.getLogger(name).setLevel(logging.CRITICAL)
+        self.configure(3)
+        for name in commands._LIBRARY_LOGGERS:
+            self.assertEqual(logging.getLogger(name).level, logging.CRITICAL)
+
+    def test_stop_log_listener_stops_thread(self):
+        """Test that stopping the listener ends its thread and forgets it."""
+        listener = self.configure(1)
+        thread = listener._thread
+
+        stop_log_listener()
+
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(commands._log_listener)
+
+    def test_log_listener_stopped_at_exit(self):
+        """Test that records queued just before exit are still written."""
+        code = (
+            "import logging\n"
+            "from codebundler.cli.commands import configure_logging\n"
+            "configure_logging(1)\n"
+            "logging.getLogger('x').warning('last words')\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout, "WARNING: last words\n")
+
+    def test_version_flag_skips_parser(self):
+        """Test that -V and --version print the version without building the parser."""
+        for flag in ("-V", "--version"):
+            with self.subTest(flag=flag), mock.patch.object(commands, "_PARSER", None):
+                buffer = io.StringIO()
+                with redirect_stdout(buffer):
+                    code = main(["src", flag, "bundle.txt"])
+
+                self.assertEqual(code, 0)
+                self.assertEqual(buffer.getvalue(), f"codebundler {__version__}\n")
+                self.assertIsNone(commands._PARSER)
+
+    def test_version_flag_after_separator_is_positional(self):
+        """Test that a -V after "--" is passed on as an argument."""
+        buffer = io.StringIO()
+        with mock.patch.object(commands, "configure_logging"):
+            with mock.patch.object(commands, "setup_tui_mode") as setup_tui_mode:
+                setup_tui_mode.return_value = 0
+                with redirect_stdout(buffer):
+                    code = main(["src", "--", "-V"])
+
+        self.assertEqual(code, 0)
+        self.assertNotIn(__version__, buffer.getvalue())
+        parsed_args = setup_tui_mode.call_args[0][0]
+        self.assertEqual(parsed_args.source_dir, "src")
+        self.assertEqual(parsed_args.output_file, "-V")
+
+
+if __name__ == "__main__":
+    unittest.main()
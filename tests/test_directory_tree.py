@@ -0,0 +1,189 @@
+"""Tests for the directory tree widget."""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from textual.app import App
+
+from codebundler.tui.widgets.directory_tree import DirectoryTree
+
+
+class TreeApp(App):
+    """Minimal app hosting a directory tree."""
+
+    def __init__(self, directory: Path) -> None:
+        super().__init__()
+        self.directory = directory
+
+    def compose(self):
+        yield DirectoryTree(self.directory)
+
+
+class TestDirectoryTree(unittest.IsolatedAsyncioTestCase):
+    """Test cases for refreshing the directory tree."""
+
+    def setUp(self):
+        """Create a small source tree."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.source_dir = Path(self.temp_dir.name)
+        for rel_path in ["pkg/a.py", "pkg/c.py", "pkg/sub/d.py", "b.py", "z.py"]:
+            path = self.source_dir / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x = 1\n")
+
+    def tearDown(self):
+        """Clean up the source tree."""
+        self.temp_dir.cleanup()
+
+    def path(self, rel_path):
+        """Return the scanned path of a file in the source tree."""
+        return os.path.join(str(self.source_dir), *rel_path.split("/"))
+
+    def child_names(self, node):
+        """Return the names of a node's children in display order."""
+        return [child.data["name"] for child in node.children]
+
+    async def mounted_tree(self, pilot):
+        """Return the app's tree once its initial scan has been added."""
+        tree = pilot.app.query_one(DirectoryTree)
+        await tree._populated.wait()
+        return tree
+
+    async def refresh(self, pilot, tree):
+        """Refresh the tree and wait for the background rescan to be applied."""
+        tree.refresh_tree()
+        await pilot.app.workers.wait_for_complete()
+
+    async def test_new_file_inserted_in_sorted_position(self):
+        """Test that a new file is added between its sorted neighbours."""
+        async with TreeApp(self.source_dir).run_test() as pilot:
+            tree = await self.mounted_tree(pilot)
+            (self.source_dir / "pkg" / "b.py").write_text("")
+            (self.source_dir / "m.py").write_text("")
+            await self.refresh(pilot, tree)
+
+            root_node = tree.root.children[0]
+            pkg = root_node.children[0]
+            self.assertEqual(
+                self.child_names(root_node), ["pkg", "b.py", "m.py", "z.py"]
+            )
+            self.assertEqual(self.child_names(pkg), ["sub", "a.py", "b.py", "c.py"])
+            self.assertIs(tree.file_nodes[self.path("pkg/b.py")], pkg.children[2])
+
+    async def test_deleted_selected_file_is_forgotten(self):
+        """Test that a deleted file leaves both the selection and the lookup."""
+        async with TreeApp(self.source_dir).run_test() as pilot:
+            tree = await self.mounted_tree(pilot)
+            deleted = self.path("pkg/sub/d.py")
+            tree.toggle_selection(tree.file_nodes[deleted])
+            tree.toggle_selection(tree.file_nodes[self.path("b.py")])
+            self.assertIn(deleted, tree.selected_files)
+
+            shutil.rmtree(self.source_dir / "pkg" / "sub")
+            await self.refresh(pilot, tree)
+
+            self.assertNotIn(deleted, tree.selected_files)
+            self.assertNotIn(deleted, tree.file_nodes)
+            self.assertEqual(tree.selected_files, {self.path("b.py")})
+
+    async def test_path_changing_type_is_replaced(self):
+        """Test that a path switching between file and directory gets a new node."""
+        async with TreeApp(self.source_dir).run_test() as pilot:
+            tree = await self.mounted_tree(pilot)
+            swapped = self.path("z.py")
+            tree.toggle_selection(tree.file_nodes[swapped])
+
+            # File to directory
+            os.unlink(swapped)
+            os.makedirs(os.path.join(swapped, "inner"))
+            Path(swapped, "inner", "e.py").write_text("")
+            await self.refresh(pilot, tree)
+
+            root_node = tree.root.children[0]
+            self.assertEqual(self.child_names(root_node), ["pkg", "z.py", "b.py"])
+            node = root_node.children[1]
+            self.assertTrue(node.data["is_dir"])
+            self.assertNotIn(swapped, tree.file_nodes)
+            self.assertNotIn(swapped, tree.selected_files)
+            self.assertIn(self.path("z.py/inner/e.py"), tree.file_nodes)
+
+            # Directory back to file
+            shutil.rmtree(swapped)
+            Path(swapped).write_text("")
+            await self.refresh(pilot, tree)
+
+            self.assertEqual(self.child_names(root_node), ["pkg", "b.py", "z.py"])
+            node = root_node.children[2]
+            self.assertFalse(node.data["is_dir"])
+            self.assertIs(tree.file_nodes[swapped], node)
+            self.assertNotIn(self.path("z.py/inner/e.py"), tree.file_nodes)
+
+    async def test_refresh_keeps_untouched_state(self):
+        """Test that expansion and selection of untouched nodes survive a refresh."""
+        async with TreeApp(self.source_dir).run_test() as pilot:
+            tree = await self.mounted_tree(pilot)
+            root_node = tree.root.children[0]
+            pkg = root_node.children[0]
+            sub = pkg.children[0]
+            pkg.expand()
+            sub.expand()
+            kept = tree.file_nodes[self.path("pkg/a.py")]
+            tree.toggle_selection(kept)
+
+            (self.source_dir / "pkg" / "new.py").write_text("")
+            os.unlink(self.path("z.py"))
+            await self.refresh(pilot, tree)
+
+            self.assertIs(root_node.children[0], pkg)
+            self.assertIs(pkg.children[0], sub)
+            self.assertTrue(pkg.is_expanded)
+            self.assertTrue(sub.is_expanded)
+            self.assertIs(tree.file_nodes[self.path("pkg/a.py")], kept)
+            self.assertTrue(kept.data["selected"])
+            self.assertEqual(tree.selected_files, {self.path("pkg/a.py")})
+            self.assertIn(self.path("pkg/new.py"), tree.file_nodes)
+
+    async def test_overlapping_refreshes_are_coalesced(self):
+        """Test that overlapping refresh requests share one rescan."""
+        async with TreeApp(self.source_dir).run_test() as pilot:
+            tree = await self.mounted_tree(pilot)
+            (self.source_dir / "m.py").write_text("")
+            with mock.patch.object(
+                tree, "_collect_tree", wraps=tree._collect_tree
+            ) as collect:
+                for _ in range(5):
+                    tree.refresh_tree()
+                await pilot.app.workers.wait_for_complete()
+
+            self.assertEqual(collect.call_count, 1)
+            self.assertIn(self.path("m.py"), tree.file_nodes)
+
+    def test_nodes_lists_deeply_expanded_tree(self):
+        """Test listing visible nodes of a tree deeper than the recursion limit."""
+        tree = DirectoryTree(self.source_dir)
+        depth = sys.getrecursionlimit() * 2
+        collected = children = []
+        for level in range(depth):
+            entry = ("d", f"/deep/{level}", f"{level}", True, [])
+            children.append(entry)
+            children = entry[4]
+        children.append(("f.py", "/deep/f.py", "f.py", False, []))
+
+        root_node = tree.root.add("deep", data={"path": "/deep", "is_dir": True})
+        tree._apply_tree(root_node, collected)
+        for node in tree.walk_tree():
+            node.expand()
+
+        nodes = tree.nodes
+        self.assertEqual(len(nodes), depth + 2)
+        self.assertIs(nodes[0], root_node)
+        self.assertIs(nodes[-1], tree.file_nodes["/deep/f.py"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,15 @@
 """Tests for the filters module."""
 
+import fnmatch
+import os
 import unittest
 
-from codebundler.core.filters import should_ignore, should_include
+from codebundler.core.filters import (
+    compile_glob_matcher,
+    compile_keyword_matcher,
+    should_ignore,
+    should_include,
+)
 
 
 class TestFilters(unittest.TestCase):
@@ -72,6 +79,38 @@ class TestFilters(unittest.TestCase):
             should_ignore("file.py", "path/src/file.py", ignore_names, ignore_paths)
         )
 
+    def test_compile_keyword_matcher_empty(self):
+        """Test that an empty keyword list compiles to no matcher."""
+        self.assertIsNone(compile_keyword_matcher([]))
+
+    def test_compile_keyword_matcher_matches_substrings(self):
+        """Test that the compiled matcher agrees with substring checks."""
+        keywords = ["test_", "a.b", "(x)"]
+        matcher = compile_keyword_matcher(keywords)
+
+        for text in ["test_file.py", "a.b.py", "axb.py", "f(x).py", "main.py"]:
+            with self.subTest(text=text):
+                self.assertEqual(
+                    bool(matcher.search(text)),
+                    any(keyword in text for keyword in keywords),
+                )
+
+    def test_compile_glob_matcher_empty(self):
+        """Test that an empty pattern list compiles to no matcher."""
+        self.assertIsNone(compile_glob_matcher([]))
+
+    def test_compile_glob_matcher_matches_fnmatch(self):
+        """Test that the compiled matcher agrees with fnmatch."""
+        patterns = ["*.min.js", "test_*.py", "build/", "[ab].txt"]
+        matcher = compile_glob_matcher(patterns)
+
+        for name in ["app.min.js", "test_x.py", "build/", "a.txt", "c.txt", "x.py"]:
+            with self.subTest(name=name):
+                self.assertEqual(
+                    bool(matcher.match(os.path.normcase(name))),
+                    any(fnmatch.fnmatch(name, pattern) for pattern in patterns),
+                )
+
 
 if __name__ == "__main__":
     unittest.main()
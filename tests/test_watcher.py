@@ -0,0 +1,101 @@
+"""Tests for the watcher module."""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from watchdog.events import FileModifiedEvent, FileOpenedEvent
+
+from codebundler.utils.watcher import CodeBundlerHandler, watch_directory
+
+
+class TestWatcher(unittest.TestCase):
+    """Test cases for the watcher module."""
+
+    def setUp(self):
+        """Set up a source directory and a handler that records callbacks."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.source_dir = os.path.realpath(self.temp_dir.name)
+        self.output_file = os.path.join(self.source_dir, "bundle.py")
+        self.calls = []
+        self.called = threading.Event()
+
+        def callback(changed_files):
+            self.calls.append(changed_files)
+            self.called.set()
+
+        self.handler = CodeBundlerHandler(
+            source_dir=self.source_dir,
+            extension=".py",
+            ignore_names=["skip"],
+            callback=callback,
+            output_file=self.output_file,
+        )
+        self.handler.debounce_time = 0.05
+
+    def tearDown(self):
+        """Stop the handler and clean up."""
+        self.handler.stop()
+        self.temp_dir.cleanup()
+
+    def path(self, rel_path):
+        """Return the absolute path of a file in the source directory."""
+        return os.path.join(self.source_dir, *rel_path.split("/"))
+
+    def test_burst_reports_once(self):
+        """Test that a burst of events produces one callback with every match."""
+        events = [
+            FileModifiedEvent(self.path("pkg/a.py")),
+            FileModifiedEvent(self.path("pkg/a.py")),
+            FileModifiedEvent(self.path("notes.txt")),
+            FileModifiedEvent(self.path("pkg/skip_me.py")),
+            FileModifiedEvent(self.output_file),
+            FileOpenedEvent(self.path("other.py")),
+            FileModifiedEvent(self.path("pkg/b.py")),
+        ]
+        for event in events:
+            self.handler.on_any_event(event)
+
+        self.assertTrue(self.called.wait(2))
+        # Give a second, wrongly split burst the chance to show up
+        time.sleep(0.2)
+        self.assertEqual(self.calls, [["pkg/a.py", "pkg/b.py"]])
+
+    def test_filtered_events_report_nothing(self):
+        """Test that events removed by the filters never reach the callback."""
+        events = [
+            FileModifiedEvent(self.path("notes.txt")),
+            FileModifiedEvent(self.path("skip.py")),
+            FileModifiedEvent(self.output_file),
+            FileOpenedEvent(self.path("a.py")),
+        ]
+        for event in events:
+            self.handler.on_any_event(event)
+
+        self.assertFalse(self.called.wait(0.3))
+        self.assertEqual(self.calls, [])
+
+    def test_stop_ends_worker_without_callback(self):
+        """Test that stopping drops pending events and ends the worker."""
+        self.handler.debounce_time = 0.3
+        self.handler.on_any_event(FileModifiedEvent(self.path("a.py")))
+        self.handler.stop()
+
+        self.assertFalse(self.handler._worker.is_alive())
+        self.assertFalse(self.called.wait(0.5))
+
+    def test_observer_stop_ends_worker(self):
+        """Test that stopping the observer also stops the handler's worker."""
+        before = threading.active_count()
+        for _ in range(3):
+            observer = watch_directory(self.source_dir, ".py")
+            observer.stop()
+            observer.join()
+
+        self.assertLessEqual(threading.active_count(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()